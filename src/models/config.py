@@ -21,6 +21,8 @@ class AWSConfig(BaseModel):
     secret_access_key: Optional[str] = None
     s3_bucket: str = Field(..., min_length=1)
     sqs_queue_url: str = Field(..., min_length=1)
+    buffered_send: bool = Field(default=False)  # Coalesce single SQS sends into batches
+    max_pool_connections: int = Field(default=64)  # HTTP connection pool size for AWS clients
     
     @validator('sqs_queue_url')
     def validate_sqs_url(cls, v):
@@ -105,7 +107,9 @@ def load_config() -> AppConfig:
             access_key_id=access_key_env,
             secret_access_key=secret_key_env,
             s3_bucket=os.getenv('AWS_S3_BUCKET', ''),
-            sqs_queue_url=os.getenv('SQS_QUEUE_URL', '')
+            sqs_queue_url=os.getenv('SQS_QUEUE_URL', ''),
+            buffered_send=os.getenv('SQS_BUFFERED_SEND', 'false').lower() == 'true',
+            max_pool_connections=int(os.getenv('AWS_MAX_POOL_CONNECTIONS', '64'))
         )
         
         # Logging Configuration
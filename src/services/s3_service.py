@@ -4,6 +4,7 @@ S3 service layer with retry logic and circuit breaker protection.
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from typing import Optional, Dict, Any, List
+import logging
 import time
 
 from ..models.config import get_config
@@ -26,6 +27,9 @@ class S3Service:
         self.metrics = get_email_parser_metrics()
         self.logger = get_logger(__name__)
         
+        # Resolved once so hot-path methods avoid the config attribute chain
+        self._default_bucket = self.config.s3_bucket
+        
         # Initialize S3 client
         self._client = None
         self._initialize_client()
@@ -88,10 +92,12 @@ class S3Service:
         Raises:
             AWSServiceError: If operation fails
         """
-        bucket_name = bucket or self.config.s3_bucket
+        bucket_name = bucket or self._default_bucket
         
         try:
-            start_time = time.time()
+            # Skip timing bookkeeping entirely when nobody will consume it
+            record_timing = self.metrics is not None or self.logger.isEnabledFor(logging.INFO)
+            start_time = time.perf_counter() if record_timing else 0.0
             
             self.logger.debug(
                 "Getting S3 object",
@@ -102,7 +108,7 @@ class S3Service:
             response = self._client.get_object(Bucket=bucket_name, Key=key)
             content = response['Body'].read()
             
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = int((time.perf_counter() - start_time) * 1000) if record_timing else None
             
             # Record success metrics
             if self.metrics:
@@ -178,10 +184,12 @@ class S3Service:
         Raises:
             AWSServiceError: If operation fails
         """
-        bucket_name = bucket or self.config.s3_bucket
+        bucket_name = bucket or self._default_bucket
         
         try:
-            start_time = time.time()
+            # Skip timing bookkeeping entirely when nobody will consume it
+            record_timing = self.metrics is not None or self.logger.isEnabledFor(logging.INFO)
+            start_time = time.perf_counter() if record_timing else 0.0
             
             self.logger.debug(
                 "Deleting S3 object",
@@ -191,7 +199,7 @@ class S3Service:
             
             self._client.delete_object(Bucket=bucket_name, Key=key)
             
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = int((time.perf_counter() - start_time) * 1000) if record_timing else None
             
             # Record success metrics
             if self.metrics:
@@ -248,6 +256,117 @@ class S3Service:
             structured_error = handle_exception(e, context={'bucket': bucket_name, 'key': key})
             raise structured_error
     
+    @retry(
+        max_attempts=3,
+        backoff_strategy=BackoffStrategy.EXPONENTIAL_JITTER,
+        retryable_exceptions=(ClientError,),
+        non_retryable_exceptions=(NoCredentialsError,)
+    )
+    def delete_objects(self, keys: List[str], bucket: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Delete multiple objects from S3 in bulk.
+
+        Uses the delete_objects API which accepts up to 1000 keys per
+        request, so batch cleanup avoids one HTTPS round-trip per key.
+
+        Args:
+            keys: S3 object keys to delete
+            bucket: S3 bucket name (uses config default if not provided)
+
+        Returns:
+            Dictionary with 'deleted' and 'errors' lists
+
+        Raises:
+            AWSServiceError: If operation fails
+        """
+        bucket_name = bucket or self._default_bucket
+        results = {'deleted': [], 'errors': []}
+
+        if not keys:
+            return results
+
+        try:
+            # Skip timing bookkeeping entirely when nobody will consume it
+            record_timing = self.metrics is not None or self.logger.isEnabledFor(logging.INFO)
+            start_time = time.perf_counter() if record_timing else 0.0
+
+            self.logger.debug(
+                "Deleting S3 objects in bulk",
+                bucket=bucket_name,
+                key_count=len(keys)
+            )
+
+            # S3 delete_objects accepts at most 1000 keys per request
+            for i in range(0, len(keys), 1000):
+                chunk = keys[i:i + 1000]
+                response = self._client.delete_objects(
+                    Bucket=bucket_name,
+                    Delete={
+                        'Objects': [{'Key': key} for key in chunk],
+                        'Quiet': True
+                    }
+                )
+                # Quiet mode omits the per-key Deleted acknowledgements,
+                # so derive them: anything in the chunk that didn't come
+                # back as an error was deleted
+                errors = response.get('Errors', [])
+                results['errors'].extend(errors)
+                if errors:
+                    errored_keys = {e.get('Key') for e in errors}
+                    results['deleted'].extend(
+                        key for key in chunk if key not in errored_keys
+                    )
+                else:
+                    results['deleted'].extend(chunk)
+
+            duration_ms = int((time.perf_counter() - start_time) * 1000) if record_timing else None
+
+            # Record success metrics
+            if self.metrics:
+                self.metrics.record_s3_operation("delete_objects", success=True)
+
+            self.logger.info(
+                "Successfully deleted S3 objects in bulk",
+                bucket=bucket_name,
+                key_count=len(keys),
+                error_count=len(results['errors']),
+                duration_ms=duration_ms
+            )
+
+            return results
+
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+
+            # Record failure metrics
+            if self.metrics:
+                self.metrics.record_s3_operation("delete_objects", success=False)
+
+            if error_code == 'AccessDenied':
+                raise AWSServiceError(
+                    message=f"Access denied to delete S3 objects in bucket: {bucket_name}",
+                    error_code=ErrorCode.S3_ACCESS_DENIED,
+                    service="S3",
+                    operation="delete_objects",
+                    cause=e
+                )
+            else:
+                raise AWSServiceError(
+                    message=f"Failed to delete S3 objects: {str(e)}",
+                    error_code=ErrorCode.UNKNOWN_ERROR,
+                    service="S3",
+                    operation="delete_objects",
+                    cause=e
+                )
+
+        except Exception as e:
+            # Record failure metrics
+            if self.metrics:
+                self.metrics.record_s3_operation("delete_objects", success=False)
+
+            structured_error = handle_exception(e, context={'bucket': bucket_name, 'key_count': len(keys)})
+            raise structured_error
+
     def list_objects(self, prefix: str = "", bucket: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         List objects in S3 bucket.
@@ -262,10 +381,12 @@ class S3Service:
         Raises:
             AWSServiceError: If operation fails
         """
-        bucket_name = bucket or self.config.s3_bucket
+        bucket_name = bucket or self._default_bucket
         
         try:
-            start_time = time.time()
+            # Skip timing bookkeeping entirely when nobody will consume it
+            record_timing = self.metrics is not None or self.logger.isEnabledFor(logging.INFO)
+            start_time = time.perf_counter() if record_timing else 0.0
             
             self.logger.debug(
                 "Listing S3 objects",
@@ -280,7 +401,7 @@ class S3Service:
             response = self._client.list_objects_v2(**kwargs)
             
             objects = response.get('Contents', [])
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = int((time.perf_counter() - start_time) * 1000) if record_timing else None
             
             # Record success metrics
             if self.metrics:
@@ -328,13 +449,16 @@ class S3Service:
         Returns:
             True if object exists
         """
-        bucket_name = bucket or self.config.s3_bucket
+        bucket_name = bucket or self._default_bucket
         
         try:
             self._client.head_object(Bucket=bucket_name, Key=key)
             return True
         except ClientError as e:
-            if e.response.get('Error', {}).get('Code') == 'NoSuchKey':
+            # head_object reports missing keys as '404'/'NotFound',
+            # not 'NoSuchKey' (that code comes from get_object)
+            error_code = e.response.get('Error', {}).get('Code')
+            if error_code in ('404', 'NotFound', 'NoSuchKey'):
                 return False
             # Re-raise other errors
             raise
@@ -353,7 +477,7 @@ class S3Service:
         Raises:
             AWSServiceError: If operation fails
         """
-        bucket_name = bucket or self.config.s3_bucket
+        bucket_name = bucket or self._default_bucket
         
         try:
             response = self._client.head_object(Bucket=bucket_name, Key=key)
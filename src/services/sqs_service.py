@@ -2,15 +2,27 @@
 SQS service layer with retry logic and circuit breaker protection.
 """
 import boto3
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError, NoCredentialsError
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import functools
+import hashlib
 import json
+import queue
+import threading
 import uuid
 import time
 
+try:
+    import orjson
+except ImportError:  # Optional dependency; stdlib json is the fallback
+    orjson = None
+
 from ..models.config import get_config
 from ..models.lead_data import LeadData
-from ..utils.logger import get_logger
+from ..utils.logger import get_logger, fast_id
 from ..utils.exceptions import AWSServiceError, ErrorCode, handle_exception
 from ..utils.retry import retry, BackoffStrategy
 from ..utils.metrics import get_email_parser_metrics
@@ -18,6 +30,182 @@ from ..utils.metrics import get_email_parser_metrics
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=16)
+def _sqs_client(
+    region_name: str,
+    access_key_id: Optional[str],
+    secret_access_key: Optional[str],
+    max_pool_connections: int = 64
+):
+    """
+    Create (or reuse) an SQS client for the given region/credentials.
+
+    Loading the botocore service model and opening the HTTPS connection
+    costs ~100 ms; caching by credentials lets every SQSService instance
+    in the process share one client and its connection pool. The pool is
+    sized above the botocore default of 10 so concurrent batch sends
+    aren't capped, and TCP keep-alive holds sockets open between bursts
+    to avoid fresh TLS handshakes (~80 ms each). botocore's own retries
+    are disabled so they don't stack with our @retry decorators.
+    """
+    client_config = {'region_name': region_name}
+    if access_key_id and secret_access_key:
+        client_config.update({
+            'aws_access_key_id': access_key_id,
+            'aws_secret_access_key': secret_access_key
+        })
+    return boto3.client(
+        'sqs',
+        config=BotoConfig(
+            max_pool_connections=max(32, max_pool_connections),
+            tcp_keepalive=True,
+            connect_timeout=2,
+            read_timeout=10,
+            retries={'max_attempts': 1, 'mode': 'standard'}
+        ),
+        **client_config
+    )
+
+
+# Batch entry IDs; SQS batches cap at 10 entries so str(idx) never varies
+_BATCH_IDS = ('0', '1', '2', '3', '4', '5', '6', '7', '8', '9')
+
+# Shared DataType fragment for string message attributes
+_STRING = {'DataType': 'String'}
+
+# Upper bound on leads pinned by the per-service serialization cache;
+# comfortably covers retries plus the largest batch in flight
+_SERIALIZE_CACHE_MAX = 256
+
+
+@dataclass
+class _SerializedLead:
+    """Message body, attributes and dedup ID serialized once per lead."""
+    body: str
+    attributes: Dict[str, Dict[str, str]]
+    dedup_id: str
+
+
+class BufferedSQSSender:
+    """
+    In-process buffer that coalesces individual lead sends into
+    send_message_batch calls.
+
+    Callers submit leads and receive a Future resolved with the SQS
+    message ID once the batch containing their lead is flushed. A batch
+    is flushed when it fills (10 messages, the SQS limit) or when the
+    buffer runs dry, so bursty producers pay one API call per ten leads
+    instead of one per lead while a lone sequential caller - who blocks
+    on its future and so can never feed a second message into the
+    window - is answered without any linger delay.
+    """
+
+    def __init__(self, service: 'SQSService', max_batch: int = 10):
+        self.service = service
+        self.max_batch = max_batch
+        self._queue: 'queue.Queue[Tuple[LeadData, str, Optional[str], Future]]' = queue.Queue()
+        self._flusher = threading.Thread(
+            target=self._flush_loop,
+            name="sqs-buffered-sender",
+            daemon=True
+        )
+        self._flusher.start()
+
+    def submit(
+        self,
+        lead_data: LeadData,
+        queue_url: str,
+        message_group_id: Optional[str] = None
+    ) -> 'Future[str]':
+        """
+        Enqueue a lead for batched sending.
+
+        Args:
+            lead_data: Lead data to send
+            queue_url: Destination SQS queue URL
+            message_group_id: Message group ID for FIFO queues
+
+        Returns:
+            Future resolved with the SQS message ID
+        """
+        future: 'Future[str]' = Future()
+        self._queue.put((lead_data, queue_url, message_group_id, future))
+        return future
+
+    def _flush_loop(self):
+        """Drain the buffer and flush batches until process exit."""
+        while True:
+            try:
+                batch = self._drain_batch()
+                if batch:
+                    self._flush_batch(batch)
+            except Exception as e:
+                # The flusher must survive; individual futures already
+                # carry their own failures
+                logger.error("Buffered SQS flusher error", error=e)
+
+    def _drain_batch(self) -> List[Tuple[LeadData, str, Optional[str], Future]]:
+        """Collect up to max_batch entries without waiting once the buffer is dry."""
+        batch = [self._queue.get()]
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                # Whoever submitted the last entry is now blocked on its
+                # future, so lingering here can't grow the batch - it
+                # only delays the waiting sender
+                break
+        return batch
+
+    def _flush_batch(self, batch: List[Tuple[LeadData, str, Optional[str], Future]]):
+        """Send one drained batch, grouped by destination queue."""
+        by_queue: Dict[str, List[Tuple[LeadData, Optional[str], Future]]] = {}
+        for lead_data, queue_url, message_group_id, future in batch:
+            by_queue.setdefault(queue_url, []).append((lead_data, message_group_id, future))
+
+        for queue_url, items in by_queue.items():
+            try:
+                entries = []
+                for idx, (lead_data, message_group_id, _) in enumerate(items):
+                    serialized = self.service._serialize_once(lead_data)
+                    entry = {
+                        'Id': str(idx),
+                        'MessageBody': serialized.body,
+                        'MessageAttributes': serialized.attributes
+                    }
+                    if queue_url.endswith('.fifo'):
+                        entry['MessageGroupId'] = message_group_id or fast_id()
+                        entry['MessageDeduplicationId'] = serialized.dedup_id
+                    entries.append(entry)
+
+                response = self.service._client.send_message_batch(
+                    QueueUrl=queue_url,
+                    Entries=entries
+                )
+
+                results: Dict[str, Dict[str, Any]] = {}
+                for success in response.get('Successful', []):
+                    results[success['Id']] = success
+                failures = {f['Id']: f for f in response.get('Failed', [])}
+
+                for idx, (lead_data, _, future) in enumerate(items):
+                    entry_id = str(idx)
+                    if entry_id in results:
+                        future.set_result(results[entry_id].get('MessageId', ''))
+                    else:
+                        failure = failures.get(entry_id, {})
+                        future.set_exception(AWSServiceError(
+                            message=f"Buffered SQS send failed: {failure.get('Message', 'unknown error')}",
+                            error_code=ErrorCode.SQS_SEND_FAILED,
+                            service="SQS",
+                            operation="send_message_batch"
+                        ))
+            except Exception as e:
+                for _, _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+
+
 class SQSService:
     """
     SQS service with robust error handling and monitoring.
@@ -29,29 +217,34 @@ class SQSService:
         self.parsing_config = app_config.parsing
         self.metrics = get_email_parser_metrics()
         self.logger = get_logger(__name__)
+        # Serialized forms keyed by lead identity (see _serialize_once).
+        # Pydantic v1 models support neither weakrefs nor hashing, so
+        # this is id-keyed with a strong reference kept alongside: the
+        # reference pins the lead alive, which guarantees its id can't
+        # be recycled into a stale hit, and the bound caps the pinning
+        self._serialize_cache: Dict[int, Tuple[LeadData, _SerializedLead]] = {}
+        self._serialize_cache_lock = threading.Lock()
         
         # Initialize SQS client (only if not in dry-run mode)
         self._client = None
+        self._buffered_sender = None
         if not self.parsing_config.dry_run_mode:
             self._initialize_client()
+            if self.config.buffered_send:
+                self._buffered_sender = BufferedSQSSender(self)
+                self.logger.info("SQS buffered sending enabled - single sends coalesce into batches")
         else:
             self.logger.info("SQS service initialized in DRY-RUN mode - messages will be logged only")
     
     def _initialize_client(self):
         """Initialize SQS client with configuration."""
         try:
-            client_config = {
-                'region_name': self.config.region_name
-            }
-            
-            # Add credentials if provided
-            if self.config.access_key_id and self.config.secret_access_key:
-                client_config.update({
-                    'aws_access_key_id': self.config.access_key_id,
-                    'aws_secret_access_key': self.config.secret_access_key
-                })
-            
-            self._client = boto3.client('sqs', **client_config)
+            self._client = _sqs_client(
+                self.config.region_name,
+                self.config.access_key_id,
+                self.config.secret_access_key,
+                self.config.max_pool_connections
+            )
             
             self.logger.info(
                 "SQS client initialized successfully",
@@ -70,6 +263,8 @@ class SQSService:
     
     @retry(
         max_attempts=3,
+        base_delay=0.1,
+        max_delay=5.0,
         backoff_strategy=BackoffStrategy.EXPONENTIAL_JITTER,
         retryable_exceptions=(ClientError,),
         non_retryable_exceptions=(NoCredentialsError,)
@@ -97,14 +292,15 @@ class SQSService:
         queue_url = queue_url or self.config.sqs_queue_url
         
         try:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
-            # Convert lead data to message payload
-            message_body = self._prepare_message_body(lead_data)
+            # Convert lead data to message payload (cached across retries)
+            serialized = self._serialize_once(lead_data)
+            message_body = serialized.body
             
             # DRY-RUN MODE: Just log the message instead of sending
             if self.parsing_config.dry_run_mode:
-                duration_ms = int((time.time() - start_time) * 1000)
+                duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
                 dry_run_message_id = f"dry-run-{uuid.uuid4().hex[:8]}"
                 
                 self.logger.info(
@@ -124,20 +320,31 @@ class SQSService:
                 
                 return dry_run_message_id
             
+            # BUFFERED MODE: coalesce into a batch send; the future
+            # resolves once the flusher ships the containing batch
+            if self._buffered_sender is not None:
+                message_id = self._buffered_sender.submit(
+                    lead_data, queue_url, message_group_id
+                ).result()
+
+                if self.metrics:
+                    self.metrics.record_sqs_message_sent(success=True)
+
+                return message_id
+
             # NORMAL MODE: Send to SQS
             # Prepare message parameters
             message_params = {
                 'QueueUrl': queue_url,
                 'MessageBody': message_body,
-                'MessageAttributes': self._create_message_attributes(lead_data)
+                'MessageAttributes': serialized.attributes
             }
             
             # Add FIFO queue specific parameters
             if queue_url.endswith('.fifo'):
-                message_params['MessageGroupId'] = message_group_id or str(uuid.uuid4().hex)
+                message_params['MessageGroupId'] = message_group_id or fast_id()
                 # Use lead data as deduplication ID to prevent duplicates
-                dedup_id = self._generate_deduplication_id(lead_data)
-                message_params['MessageDeduplicationId'] = dedup_id
+                message_params['MessageDeduplicationId'] = serialized.dedup_id
             
             self.logger.debug(
                 "Sending lead message to SQS",
@@ -148,7 +355,7 @@ class SQSService:
             
             response = self._client.send_message(**message_params)
             
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             message_id = response.get('MessageId', '')
             
             # Record success metrics
@@ -195,6 +402,44 @@ class SQSService:
             )
             raise structured_error
     
+    def _serialize_once(self, lead_data: LeadData) -> _SerializedLead:
+        """
+        Serialize a lead for SQS exactly once per instance.
+
+        The body JSON, message attributes and dedup hash all walk the
+        same fields; caching the triple by lead identity means retries
+        and the batch path skip re-serialization. The cache lives on
+        the service so the model's __dict__, equality and .dict()/
+        .json() output stay untouched. Callers that mutate a lead's
+        metadata after a send must not reuse the same instance.
+
+        Args:
+            lead_data: Lead data to serialize
+
+        Returns:
+            Cached serialized form of the lead
+        """
+        entry = self._serialize_cache.get(id(lead_data))
+        if entry is not None and entry[0] is lead_data:
+            return entry[1]
+
+        serialized = _SerializedLead(
+            body=self._prepare_message_body(lead_data),
+            attributes=self._create_message_attributes(lead_data),
+            dedup_id=self._generate_deduplication_id(lead_data)
+        )
+        # The batch path fans _serialize_once across pool threads, so
+        # evict-then-insert must be atomic: two threads racing the same
+        # "oldest" key would KeyError the loser. Hits above stay
+        # lock-free since entries are never mutated after insertion
+        cache = self._serialize_cache
+        with self._serialize_cache_lock:
+            if len(cache) >= _SERIALIZE_CACHE_MAX:
+                # Evict oldest inserted; retries reuse recent entries
+                del cache[next(iter(cache))]
+            cache[id(lead_data)] = (lead_data, serialized)
+        return serialized
+
     def _prepare_message_body(self, lead_data: LeadData) -> str:
         """
         Prepare message body from lead data.
@@ -221,6 +466,10 @@ class SQSService:
                 'metadata': lead_data.metadata or {}
             }
             
+            # orjson encodes small dicts several times faster than the
+            # stdlib encoder and this runs once per message
+            if orjson is not None:
+                return orjson.dumps(message_data, default=str).decode('utf-8')
             return json.dumps(message_data, default=str)
             
         except Exception as e:
@@ -243,62 +492,50 @@ class SQSService:
             Message attributes dictionary
         """
         attributes = {
-            'LeadSource': {
-                'StringValue': lead_data.lead_source,
-                'DataType': 'String'
-            }
+            'LeadSource': {'StringValue': lead_data.lead_source, **_STRING}
         }
         
         if lead_data.resale_reference:
-            attributes['ResaleReference'] = {
-                'StringValue': lead_data.resale_reference,
-                'DataType': 'String'
-            }
+            attributes['ResaleReference'] = {'StringValue': lead_data.resale_reference, **_STRING}
         
         if lead_data.contact_info.email:
-            attributes['ContactEmail'] = {
-                'StringValue': lead_data.contact_info.email,
-                'DataType': 'String'
-            }
+            attributes['ContactEmail'] = {'StringValue': lead_data.contact_info.email, **_STRING}
         
-        # Add parser information if available
-        parser_used = lead_data.metadata.get('parser_used')
+        # Add parser information if available (metadata is commonly empty)
+        parser_used = lead_data.metadata and lead_data.metadata.get('parser_used')
         if parser_used:
-            attributes['ParserUsed'] = {
-                'StringValue': parser_used,
-                'DataType': 'String'
-            }
+            attributes['ParserUsed'] = {'StringValue': parser_used, **_STRING}
         
         return attributes
     
     def _generate_deduplication_id(self, lead_data: LeadData) -> str:
         """
         Generate deduplication ID for FIFO queues.
-        
+
+        Hashes only the lead's stable identity fields; the serialized
+        body also carries per-run metadata timestamps, so hashing it
+        would give a reprocessed email a fresh dedup ID every time.
+
         Args:
-            lead_data: Lead data
-            
+            lead_data: Lead data to identify
+
         Returns:
             Deduplication ID
         """
-        # Create a unique ID based on lead content to prevent duplicates
-        dedup_components = [
+        dedup_string = '|'.join([
             lead_data.lead_source,
             lead_data.contact_info.email or '',
             lead_data.resale_reference or '',
             lead_data.receipt_date.isoformat() if lead_data.receipt_date else ''
-        ]
-        
-        dedup_string = '|'.join(dedup_components)
-        
-        # Use hash of the string as deduplication ID (truncated to fit SQS limits)
-        import hashlib
-        dedup_hash = hashlib.sha256(dedup_string.encode()).hexdigest()
-        
-        return dedup_hash[:80]  # SQS deduplication ID max length is 128 chars
+        ])
+        # BLAKE2b is 2-3x faster than SHA-256 in CPython for short
+        # inputs; 40 bytes gives 80 hex chars, under the SQS 128 limit
+        return hashlib.blake2b(dedup_string.encode('utf-8'), digest_size=40).hexdigest()
     
     @retry(
         max_attempts=3,
+        base_delay=0.1,
+        max_delay=5.0,
         backoff_strategy=BackoffStrategy.EXPONENTIAL_JITTER,
         retryable_exceptions=(ClientError,),
         non_retryable_exceptions=(NoCredentialsError,)
@@ -328,12 +565,26 @@ class SQSService:
         
         # SQS batch limit is 10 messages
         batch_size = 10
-        all_message_ids = []
+        batches = [
+            lead_data_list[i:i + batch_size]
+            for i in range(0, len(lead_data_list), batch_size)
+        ]
         
-        for i in range(0, len(lead_data_list), batch_size):
-            batch = lead_data_list[i:i + batch_size]
-            batch_message_ids = self._send_message_batch(batch, queue_url)
-            all_message_ids.extend(batch_message_ids)
+        if len(batches) == 1:
+            return self._send_message_batch(batches[0], queue_url)
+        
+        # Fan the batches out concurrently; each one is a full HTTPS
+        # round-trip, so sequential sends are RTT-bound rather than
+        # CPU-bound. boto3 clients are thread-safe, and map() preserves
+        # input order in the flattened result.
+        all_message_ids = []
+        with ThreadPoolExecutor(max_workers=min(len(batches), 10)) as executor:
+            for batch_message_ids in executor.map(
+                self._send_message_batch,
+                batches,
+                (queue_url,) * len(batches)
+            ):
+                all_message_ids.extend(batch_message_ids)
         
         return all_message_ids
     
@@ -349,23 +600,35 @@ class SQSService:
             List of message IDs
         """
         try:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             # Prepare batch entries
-            entries = []
-            for idx, lead_data in enumerate(lead_data_batch):
-                entry = {
-                    'Id': str(idx),
-                    'MessageBody': self._prepare_message_body(lead_data),
-                    'MessageAttributes': self._create_message_attributes(lead_data)
-                }
-                
-                # Add FIFO queue specific parameters
-                if queue_url.endswith('.fifo'):
-                    entry['MessageGroupId'] = str(uuid.uuid4().hex)
-                    entry['MessageDeduplicationId'] = self._generate_deduplication_id(lead_data)
-                
-                entries.append(entry)
+            serialized_batch = [self._serialize_once(lead_data) for lead_data in lead_data_batch]
+            is_fifo = queue_url.endswith('.fifo')
+            
+            if is_fifo:
+                # One shared group ID per batch: same group means SQS
+                # keeps the batch ordered, and we skip a fresh ID per entry
+                default_group_id = fast_id()
+                entries = [
+                    {
+                        'Id': _BATCH_IDS[idx],
+                        'MessageBody': serialized.body,
+                        'MessageAttributes': serialized.attributes,
+                        'MessageGroupId': default_group_id,
+                        'MessageDeduplicationId': serialized.dedup_id
+                    }
+                    for idx, serialized in enumerate(serialized_batch)
+                ]
+            else:
+                entries = [
+                    {
+                        'Id': _BATCH_IDS[idx],
+                        'MessageBody': serialized.body,
+                        'MessageAttributes': serialized.attributes
+                    }
+                    for idx, serialized in enumerate(serialized_batch)
+                ]
             
             self.logger.debug(
                 "Sending batch messages to SQS",
@@ -378,7 +641,7 @@ class SQSService:
                 Entries=entries
             )
             
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             # Extract message IDs from successful sends
             message_ids = []
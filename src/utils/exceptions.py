@@ -40,6 +40,8 @@ class ErrorCode(str, Enum):
 class BaseEmailParserException(Exception):
     """Base exception for all email parser errors."""
     
+    __slots__ = ('message', 'error_code', 'details', 'cause')
+    
     def __init__(
         self,
         message: str,
@@ -67,6 +69,8 @@ class BaseEmailParserException(Exception):
 class ConfigurationError(BaseEmailParserException):
     """Raised when configuration is missing or invalid."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, missing_keys: Optional[list] = None):
         super().__init__(
             message=message,
@@ -78,6 +82,8 @@ class ConfigurationError(BaseEmailParserException):
 class EmailProcessingError(BaseEmailParserException):
     """Raised when email processing fails."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -96,6 +102,8 @@ class EmailProcessingError(BaseEmailParserException):
 class LeadParsingError(BaseEmailParserException):
     """Raised when lead data parsing fails."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -121,6 +129,8 @@ class LeadParsingError(BaseEmailParserException):
 class AWSServiceError(BaseEmailParserException):
     """Raised when AWS service operations fail."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -143,6 +153,8 @@ class AWSServiceError(BaseEmailParserException):
 class ValidationError(BaseEmailParserException):
     """Raised when data validation fails."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -160,6 +172,8 @@ class ValidationError(BaseEmailParserException):
 class ProcessingTimeoutError(BaseEmailParserException):
     """Raised when processing exceeds timeout."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, timeout_seconds: int):
         super().__init__(
             message=message,
@@ -171,6 +185,8 @@ class ProcessingTimeoutError(BaseEmailParserException):
 class RetryExhaustedError(BaseEmailParserException):
     """Raised when retry attempts are exhausted."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, max_attempts: int, last_error: Optional[Exception] = None):
         super().__init__(
             message=message,
@@ -180,6 +196,45 @@ class RetryExhaustedError(BaseEmailParserException):
         )
 
 
+def _access_denied(exception: Exception) -> 'AWSServiceError':
+    return AWSServiceError(
+        message=f"AWS access denied: {str(exception)}",
+        error_code=ErrorCode.S3_ACCESS_DENIED,
+        service="AWS",
+        cause=exception
+    )
+
+
+def _not_found(exception: Exception) -> 'AWSServiceError':
+    return AWSServiceError(
+        message=f"AWS resource not found: {str(exception)}",
+        error_code=ErrorCode.S3_OBJECT_NOT_FOUND,
+        service="AWS",
+        cause=exception
+    )
+
+
+def _timed_out(exception: Exception) -> 'ProcessingTimeoutError':
+    return ProcessingTimeoutError(
+        message=f"Operation timed out: {str(exception)}",
+        timeout_seconds=30  # Default timeout
+    )
+
+
+# O(1) dispatch by exception class name; avoids formatting str(exception)
+# just to substring-search it on every error path
+_HANDLERS = {
+    'NoCredentialsError': _access_denied,
+    'AccessDenied': _access_denied,
+    'NoSuchKey': _not_found,
+    'NotFound': _not_found,
+    'TimeoutError': _timed_out,
+    'ReadTimeoutError': _timed_out,
+    'ConnectTimeoutError': _timed_out,
+    'ProcessingTimeoutError': _timed_out,
+}
+
+
 def handle_exception(
     exception: Exception,
     context: Optional[Dict[str, Any]] = None,
@@ -199,30 +254,20 @@ def handle_exception(
     if isinstance(exception, BaseEmailParserException):
         return exception
     
-    # Map common AWS exceptions
-    exception_name = type(exception).__name__
+    # Map common AWS exceptions by class name
+    handler = _HANDLERS.get(type(exception).__name__)
+    if handler is not None:
+        return handler(exception)
     
-    if 'NoCredentialsError' in exception_name or 'AccessDenied' in str(exception):
-        return AWSServiceError(
-            message=f"AWS access denied: {str(exception)}",
-            error_code=ErrorCode.S3_ACCESS_DENIED,
-            service="AWS",
-            cause=exception
-        )
-    
-    if 'NoSuchKey' in exception_name or 'NotFound' in str(exception):
-        return AWSServiceError(
-            message=f"AWS resource not found: {str(exception)}",
-            error_code=ErrorCode.S3_OBJECT_NOT_FOUND,
-            service="AWS",
-            cause=exception
-        )
-    
-    if 'TimeoutError' in exception_name or 'timeout' in str(exception).lower():
-        return ProcessingTimeoutError(
-            message=f"Operation timed out: {str(exception)}",
-            timeout_seconds=30  # Default timeout
-        )
+    # botocore ClientError carries its AWS error code structurally;
+    # read it instead of substring-searching the formatted message
+    response = getattr(exception, 'response', None)
+    if isinstance(response, dict):
+        code = response.get('Error', {}).get('Code', '')
+        if 'AccessDenied' in code:
+            return _access_denied(exception)
+        if code in ('NoSuchKey', 'NotFound', '404'):
+            return _not_found(exception)
     
     # Default handling
     return BaseEmailParserException(
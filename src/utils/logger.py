@@ -1,15 +1,48 @@
 """
 Structured logging system with CloudWatch integration and correlation tracking.
 """
+import itertools
 import json
 import logging
+import os
 import sys
+import threading
+import time
 import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional
 from contextlib import contextmanager
 import traceback
 
+try:
+    import orjson
+except ImportError:  # Optional dependency; stdlib json is the fallback
+    orjson = None
+
+# LogRecord attributes excluded when copying extra data into the JSON
+# payload; built once instead of per formatted line
+_SKIP_RECORD_FIELDS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno',
+    'pathname', 'filename', 'module', 'lineno',
+    'funcName', 'created', 'msecs', 'relativeCreated',
+    'thread', 'threadName', 'processName', 'process',
+    'getMessage', 'exc_info', 'exc_text', 'stack_info'
+})
+
+_PID = os.getpid()
+_id_counter = itertools.count()
+
+
+def fast_id() -> str:
+    """
+    Generate a cheap process-unique identifier.
+
+    uuid4 reads 16 bytes from os.urandom per call; a pid + counter +
+    nanosecond timestamp is unique enough for correlation/grouping IDs
+    and avoids the syscall on hot paths.
+    """
+    return f"{_PID:x}-{next(_id_counter):x}-{time.time_ns():x}"
+
 
 class StructuredLogger:
     """
@@ -44,12 +77,17 @@ class StructuredLogger:
     def get_correlation_id(self) -> Optional[str]:
         """Get current correlation ID."""
         return self._correlation_id
+
+    def isEnabledFor(self, level: int) -> bool:
+        """Check if the underlying logger would emit at the given level."""
+        return self.logger.isEnabledFor(level)
     
     def _log(self, level: str, message: str, **kwargs):
         """Internal logging method with structured data."""
+        # No timestamp here: JSONFormatter already derives one from
+        # record.created, so building a datetime per line is wasted work
         extra_data = {
             'correlation_id': self._correlation_id,
-            'timestamp': datetime.utcnow().isoformat(),
             'service': 'email-parser',
             **kwargs
         }
@@ -61,35 +99,48 @@ class StructuredLogger:
     
     def debug(self, message: str, **kwargs):
         """Log debug message."""
-        self._log('DEBUG', message, **kwargs)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log('DEBUG', message, **kwargs)
     
     def info(self, message: str, **kwargs):
         """Log info message."""
-        self._log('INFO', message, **kwargs)
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log('INFO', message, **kwargs)
     
     def warning(self, message: str, **kwargs):
         """Log warning message."""
-        self._log('WARNING', message, **kwargs)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log('WARNING', message, **kwargs)
     
     def error(self, message: str, error: Optional[Exception] = None, **kwargs):
         """Log error message with optional exception details."""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         if error:
             kwargs.update({
                 'error_type': type(error).__name__,
-                'error_message': str(error),
-                'traceback': traceback.format_exc()
+                'error_message': str(error)
             })
+            # format_exc() renders whatever exception is *currently*
+            # being handled, which for errors caught elsewhere is
+            # nothing ("NoneType: None"). Format this error's own
+            # traceback, and only when it actually has one.
+            if error.__traceback__ is not None:
+                kwargs['traceback'] = ''.join(
+                    traceback.format_exception(type(error), error, error.__traceback__)
+                )
         self._log('ERROR', message, **kwargs)
     
     def critical(self, message: str, **kwargs):
         """Log critical message."""
-        self._log('CRITICAL', message, **kwargs)
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self._log('CRITICAL', message, **kwargs)
     
     @contextmanager
     def operation_context(self, operation: str, **context_data):
         """Context manager for operation logging with timing."""
-        start_time = datetime.utcnow()
-        operation_id = str(uuid.uuid4())
+        start_ns = time.perf_counter_ns()
+        operation_id = fast_id()
         
         self.info(
             f"Starting operation: {operation}",
@@ -100,7 +151,7 @@ class StructuredLogger:
         
         try:
             yield operation_id
-            duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             self.info(
                 f"Completed operation: {operation}",
                 operation=operation,
@@ -109,7 +160,7 @@ class StructuredLogger:
                 status="success"
             )
         except Exception as e:
-            duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             self.error(
                 f"Failed operation: {operation}",
                 error=e,
@@ -137,15 +188,19 @@ class JSONFormatter(logging.Formatter):
         }
         
         # Add extra data if present
-        if hasattr(record, '__dict__'):
-            for key, value in record.__dict__.items():
-                if key not in ['name', 'msg', 'args', 'levelname', 'levelno',
-                              'pathname', 'filename', 'module', 'lineno',
-                              'funcName', 'created', 'msecs', 'relativeCreated',
-                              'thread', 'threadName', 'processName', 'process',
-                              'getMessage', 'exc_info', 'exc_text', 'stack_info']:
-                    log_data[key] = value
+        log_data.update(
+            (key, value) for key, value in record.__dict__.items()
+            if key not in _SKIP_RECORD_FIELDS
+        )
         
+        if orjson is not None:
+            # OPT_NON_STR_KEYS matches the stdlib fallback: json.dumps
+            # stringifies int/float/bool/None dict keys, while orjson
+            # raises TypeError for them (default= never sees keys) -
+            # and a formatter that throws loses the log line entirely
+            return orjson.dumps(
+                log_data, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode('utf-8')
         return json.dumps(log_data, default=str)
 
 
@@ -153,6 +208,7 @@ class LoggerFactory:
     """Factory for creating configured loggers."""
     
     _loggers: Dict[str, StructuredLogger] = {}
+    _lock = threading.Lock()
     _default_level = "INFO"
     _default_format = "json"
     
@@ -165,13 +221,23 @@ class LoggerFactory:
     @classmethod
     def get_logger(cls, name: str) -> StructuredLogger:
         """Get or create a logger instance."""
-        if name not in cls._loggers:
-            cls._loggers[name] = StructuredLogger(
-                name=name,
-                level=cls._default_level,
-                format_type=cls._default_format
-            )
-        return cls._loggers[name]
+        # Lock-free hit path; construction is double-checked under the
+        # lock so two threads can't build duplicate StructuredLoggers
+        # (each attaching its own stdout handler = doubled log lines)
+        logger = cls._loggers.get(name)
+        if logger is not None:
+            return logger
+        
+        with cls._lock:
+            logger = cls._loggers.get(name)
+            if logger is None:
+                logger = StructuredLogger(
+                    name=name,
+                    level=cls._default_level,
+                    format_type=cls._default_format
+                )
+                cls._loggers[name] = logger
+            return logger
 
 
 # Convenience function for getting logger
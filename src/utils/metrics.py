@@ -1,21 +1,25 @@
 """
 CloudWatch metrics and monitoring utilities for the email parser system.
 """
+import atexit
+import logging
+import queue
+import threading
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 import boto3
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
 from .logger import get_logger
-from .exceptions import AWSServiceError, ErrorCode
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricData:
     """Container for metric data."""
     name: str
@@ -34,20 +38,113 @@ class MetricsCollector:
         self,
         namespace: str = "FranchiseResales/EmailParser",
         region_name: str = "eu-west-2",
-        batch_size: int = 20
+        batch_size: int = 20,
+        flush_interval: float = 10.0
     ):
         self.namespace = namespace
+        self.region_name = region_name
+        # CloudWatch rejects put_metric_data requests beyond its limits,
+        # losing the whole batch; clamp rather than fail at flush time
+        if batch_size > 1000:
+            logger.warning(
+                f"Metrics batch_size {batch_size} exceeds CloudWatch limit, clamping to 1000"
+            )
+            batch_size = 1000
         self.batch_size = batch_size
-        self._metrics_buffer: List[MetricData] = []
+        # Aggregation buffer keyed by (name, unit, dimensions): repeated
+        # Count increments collapse into one datapoint instead of each
+        # occupying a slot in the CloudWatch batch
+        self._agg: Dict[Tuple[str, str, Tuple[Tuple[str, str], ...]], MetricData] = {}
+        # Distribution buffer: {key: {rounded value: occurrence count}}.
+        # Flushed as CloudWatch Values/Counts arrays so up to 150 timing
+        # observations share one MetricDatum
+        self._dist: Dict[Tuple[str, str, Tuple[Tuple[str, str], ...]], Dict[float, int]] = {}
+        self._lock = threading.Lock()
+        self._flush_interval = flush_interval
+        # Freelist of MetricData slots reused between flushes so steady
+        # metric traffic doesn't allocate a fresh object per datapoint
+        self._pool: List[MetricData] = []
+        # Second-resolution timestamp cache; CloudWatch stores metric
+        # timestamps at 1 s granularity, so one datetime per second is
+        # enough for every datapoint recorded within it
+        self._ts_epoch = 0
+        self._ts: Optional[datetime] = None
+        # Serialized Dimensions lists keyed by the sorted dimension
+        # items; the same handful of label sets recur on every flush,
+        # so build each [{'Name':..,'Value':..}] list once. Bounded in
+        # case of unbounded label cardinality upstream
+        self._dim_cache: Dict[Tuple[Tuple[str, str], ...], List[Dict[str, str]]] = {}
+        # Log level doesn't change at runtime here, so resolve the
+        # isEnabledFor walk once instead of on every datapoint
+        self._debug_metrics = logger.isEnabledFor(logging.DEBUG)
         
         try:
-            self.cloudwatch = boto3.client('cloudwatch', region_name=region_name)
+            # Metrics are fire-and-forget: botocore's default retry
+            # loop would stall the flush path, so retries are disabled
+            # and keep-alive avoids a TLS handshake per flush interval
+            self.cloudwatch = boto3.client(
+                'cloudwatch',
+                region_name=region_name,
+                config=BotoConfig(
+                    retries={'max_attempts': 0, 'mode': 'standard'},
+                    max_pool_connections=50,
+                    tcp_keepalive=True
+                )
+            )
         except Exception as e:
             logger.warning(
                 "Failed to initialize CloudWatch client, metrics will be logged only",
                 error=str(e)
             )
             self.cloudwatch = None
+        
+        # Periodic background flush bounds how long aggregated counters
+        # sit in the buffer once traffic stops; atexit drains the rest
+        self._flush_thread = threading.Thread(
+            target=self._periodic_flush,
+            name="metrics-flush",
+            daemon=True
+        )
+        self._flush_thread.start()
+        # Serialized batches are handed to a dedicated uploader thread
+        # so flush() callers never block on the CloudWatch round trip.
+        # The queue is shallow on purpose: if uploads can't keep up we
+        # drop the oldest batch rather than grow without bound
+        self._upload_queue: queue.Queue = queue.Queue(maxsize=4)
+        self._dropped = 0
+        self._uploader_thread = threading.Thread(
+            target=self._uploader_loop,
+            name="metrics-upload",
+            daemon=True
+        )
+        self._uploader_thread.start()
+        atexit.register(self.drain)
+    
+    def _dims_list(self, dim_items: Tuple[Tuple[str, str], ...]) -> List[Dict[str, str]]:
+        """Return the CloudWatch Dimensions list for sorted dimension items."""
+        dims = self._dim_cache.get(dim_items)
+        if dims is None:
+            dims = [{'Name': k, 'Value': v} for k, v in dim_items]
+            if len(self._dim_cache) < 256:
+                self._dim_cache[dim_items] = dims
+        return dims
+    
+    def _cached_now(self) -> datetime:
+        """Return a datetime reused for all metrics within the same second."""
+        now = int(time.time())
+        if now != self._ts_epoch:
+            self._ts_epoch = now
+            self._ts = datetime.utcnow()
+        return self._ts
+    
+    def _periodic_flush(self):
+        """Flush buffered metrics every flush_interval seconds."""
+        while True:
+            time.sleep(self._flush_interval)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning("Periodic metrics flush failed", error=str(e))
     
     def put_metric(
         self,
@@ -67,95 +164,226 @@ class MetricsCollector:
             dimensions: Metric dimensions for filtering
             timestamp: Metric timestamp (defaults to now)
         """
-        metric = MetricData(
-            name=name,
-            value=value,
-            unit=unit,
-            dimensions=dimensions or {},
-            timestamp=timestamp or datetime.utcnow()
-        )
+        dimensions = dimensions or {}
+        key = (name, unit, tuple(sorted(dimensions.items())))
         
-        self._metrics_buffer.append(metric)
+        with self._lock:
+            existing = self._agg.get(key)
+            if existing is not None:
+                if unit == "Count":
+                    # Counters sum client-side
+                    existing.value += value
+                else:
+                    # Gauges/timings keep the most recent observation
+                    existing.value = value
+                    existing.timestamp = timestamp or self._cached_now()
+            else:
+                if self._pool:
+                    metric = self._pool.pop()
+                    metric.name = name
+                    metric.value = value
+                    metric.unit = unit
+                    metric.dimensions = dimensions
+                    metric.timestamp = timestamp or self._cached_now()
+                else:
+                    metric = MetricData(
+                        name=name,
+                        value=value,
+                        unit=unit,
+                        dimensions=dimensions,
+                        timestamp=timestamp or self._cached_now()
+                    )
+                self._agg[key] = metric
+            buffered = len(self._agg) + len(self._dist)
         
-        # Log the metric
-        logger.debug(
-            f"Metric recorded: {name}",
-            metric_name=name,
-            metric_value=value,
-            metric_unit=unit,
-            metric_dimensions=dimensions
-        )
+        # Log the metric (guarded so the f-string isn't formatted
+        # when DEBUG is off)
+        if self._debug_metrics:
+            logger.debug(
+                f"Metric recorded: {name}",
+                metric_name=name,
+                metric_value=value,
+                metric_unit=unit,
+                metric_dimensions=dimensions
+            )
         
         # Send batch if buffer is full
-        if len(self._metrics_buffer) >= self.batch_size:
+        if buffered >= self.batch_size:
+            self.flush()
+    
+    def put_distribution(
+        self,
+        name: str,
+        value: float,
+        unit: str = "Milliseconds",
+        dimensions: Optional[Dict[str, str]] = None
+    ):
+        """
+        Record one observation of a distribution metric (e.g. a timing).
+        
+        Observations accumulate as value->count pairs and flush as a
+        single MetricDatum with Values/Counts arrays, so bursts of
+        timings don't consume one batch slot each while CloudWatch can
+        still derive percentiles.
+        
+        Args:
+            name: Metric name
+            value: Observed value
+            unit: Metric unit
+            dimensions: Metric dimensions for filtering
+        """
+        dimensions = dimensions or {}
+        key = (name, unit, tuple(sorted(dimensions.items())))
+        
+        # Round to bound the number of distinct values per datum
+        rounded = round(value, 2)
+        with self._lock:
+            bucket = self._dist.setdefault(key, {})
+            bucket[rounded] = bucket.get(rounded, 0) + 1
+            buffered = len(self._agg) + len(self._dist)
+        
+        if buffered >= self.batch_size:
             self.flush()
     
     def flush(self):
-        """Send all buffered metrics to CloudWatch."""
-        if not self._metrics_buffer:
-            return
+        """Serialize buffered metrics and hand them to the uploader thread."""
+        # Snapshot and clear under the lock; serialization happens
+        # outside so producers aren't blocked, and the network call
+        # happens on the uploader thread so *this* caller isn't either
+        with self._lock:
+            if not self._agg and not self._dist:
+                return
+            metrics = list(self._agg.items())
+            distributions = list(self._dist.items())
+            self._agg.clear()
+            self._dist.clear()
         
         if not self.cloudwatch:
             logger.warning(
-                f"CloudWatch client not available, discarding {len(self._metrics_buffer)} metrics"
+                f"CloudWatch client not available, discarding {len(metrics) + len(distributions)} metrics"
             )
-            self._metrics_buffer.clear()
             return
         
-        try:
-            # Convert metrics to CloudWatch format
-            metric_data = []
-            for metric in self._metrics_buffer:
+        # Convert metrics to CloudWatch format
+        metric_data = []
+        for (_, _, dim_items), metric in metrics:
+            data = {
+                'MetricName': metric.name,
+                'Value': metric.value,
+                'Unit': metric.unit,
+                'Timestamp': metric.timestamp
+            }
+            
+            if dim_items:
+                data['Dimensions'] = self._dims_list(dim_items)
+            
+            metric_data.append(data)
+        
+        # Serialized copies are on the wire format now; recycle the
+        # MetricData slots (bounded so bursts don't pin memory)
+        with self._lock:
+            space = 2 * self.batch_size - len(self._pool)
+            if space > 0:
+                self._pool.extend(m for _, m in metrics[:space])
+        
+        now = datetime.utcnow()
+        for (name, unit, dim_items), bucket in distributions:
+            values = list(bucket.keys())
+            counts = list(bucket.values())
+            # CloudWatch caps Values/Counts at 150 entries per datum
+            for start in range(0, len(values), 150):
                 data = {
-                    'MetricName': metric.name,
-                    'Value': metric.value,
-                    'Unit': metric.unit,
-                    'Timestamp': metric.timestamp
+                    'MetricName': name,
+                    'Values': values[start:start + 150],
+                    'Counts': counts[start:start + 150],
+                    'Unit': unit,
+                    'Timestamp': now
                 }
-                
-                if metric.dimensions:
-                    data['Dimensions'] = [
-                        {'Name': k, 'Value': v}
-                        for k, v in metric.dimensions.items()
-                    ]
-                
+                if dim_items:
+                    data['Dimensions'] = self._dims_list(dim_items)
                 metric_data.append(data)
+        
+        # Surface batches lost to queue overflow as a metric of our own
+        with self._lock:
+            dropped = self._dropped
+            self._dropped = 0
+        if dropped:
+            metric_data.append({
+                'MetricName': 'MetricsDropped',
+                'Value': float(dropped),
+                'Unit': 'Count',
+                'Timestamp': now
+            })
+        
+        self._enqueue_upload(metric_data)
+    
+    def _enqueue_upload(self, metric_data: List[Dict[str, Any]]):
+        """Queue a serialized batch, dropping the oldest on overflow."""
+        while True:
+            try:
+                self._upload_queue.put_nowait(metric_data)
+                return
+            except queue.Full:
+                try:
+                    stale = self._upload_queue.get_nowait()
+                    with self._lock:
+                        self._dropped += len(stale)
+                except queue.Empty:
+                    continue
+    
+    def _uploader_loop(self):
+        """Drain the upload queue, sending each batch to CloudWatch."""
+        while True:
+            self._send(self._upload_queue.get())
+    
+    def drain(self):
+        """
+        Flush and upload all pending metrics synchronously.
+
+        Lambda freezes the execution environment as soon as the handler
+        returns, so atexit and the uploader thread can't be relied on to
+        ship the last batches; the handler calls this before returning.
+        """
+        self.flush()
+        while True:
+            try:
+                batch = self._upload_queue.get_nowait()
+            except queue.Empty:
+                return
+            self._send(batch)
+    
+    def _send(self, metric_data: List[Dict[str, Any]]):
+        """Send one serialized batch to CloudWatch."""
+        try:
+            # Send to CloudWatch in slices of 20 MetricData entries,
+            # the per-request API limit
+            for start in range(0, len(metric_data), 20):
+                self.cloudwatch.put_metric_data(
+                    Namespace=self.namespace,
+                    MetricData=metric_data[start:start + 20]
+                )
             
-            # Send to CloudWatch
-            self.cloudwatch.put_metric_data(
-                Namespace=self.namespace,
-                MetricData=metric_data
-            )
-            
-            logger.debug(
-                f"Successfully sent {len(metric_data)} metrics to CloudWatch",
-                namespace=self.namespace,
-                metric_count=len(metric_data)
-            )
+            if self._debug_metrics:
+                logger.debug(
+                    f"Successfully sent {len(metric_data)} metrics to CloudWatch",
+                    namespace=self.namespace,
+                    metric_count=len(metric_data)
+                )
             
         except ClientError as e:
             logger.error(
                 "Failed to send metrics to CloudWatch",
                 error=e,
                 namespace=self.namespace,
-                metric_count=len(self._metrics_buffer)
-            )
-            raise AWSServiceError(
-                message=f"Failed to send metrics: {str(e)}",
-                error_code=ErrorCode.UNKNOWN_ERROR,
-                service="CloudWatch",
-                operation="put_metric_data",
-                cause=e
+                metric_count=len(metric_data)
             )
         except Exception as e:
             logger.error(
                 "Unexpected error sending metrics",
                 error=e,
                 namespace=self.namespace,
-                metric_count=len(self._metrics_buffer)
+                metric_count=len(metric_data)
             )
-        finally:
-            self._metrics_buffer.clear()
     
     @contextmanager
     def timer(
@@ -170,12 +398,12 @@ class MetricsCollector:
             metric_name: Name of the timing metric
             dimensions: Additional dimensions for the metric
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             yield
         finally:
-            duration = (time.time() - start_time) * 1000  # Convert to milliseconds
-            self.put_metric(
+            duration = (time.perf_counter_ns() - start_ns) / 1e6  # Convert to milliseconds
+            self.put_distribution(
                 name=metric_name,
                 value=duration,
                 unit="Milliseconds",
@@ -196,13 +424,27 @@ class MetricsCollector:
             value: Value to increment by (default: 1)
             dimensions: Additional dimensions for the metric
         """
+        # Fast path: a counter that already has a buffered entry just
+        # bumps it in place. The buffer size doesn't change on a hit,
+        # so neither the flush threshold check nor the pool matter
+        key = (
+            metric_name,
+            "Count",
+            tuple(sorted(dimensions.items())) if dimensions else ()
+        )
+        with self._lock:
+            existing = self._agg.get(key)
+            if existing is not None:
+                existing.value += value
+                return
+
         self.put_metric(
             name=metric_name,
             value=float(value),
             unit="Count",
             dimensions=dimensions
         )
-    
+
     def record_gauge(
         self,
         metric_name: str,
@@ -249,7 +491,7 @@ class EmailParserMetrics:
     
     def record_parsing_time(self, lead_source: str, duration_ms: float):
         """Record parsing duration."""
-        self.collector.put_metric(
+        self.collector.put_distribution(
             "ParsingDuration",
             value=duration_ms,
             unit="Milliseconds",
@@ -289,13 +531,13 @@ class EmailParserMetrics:
     
     def record_lambda_invocation(self, duration_ms: float, memory_used_mb: float):
         """Record Lambda invocation metrics."""
-        self.collector.put_metric(
+        self.collector.put_distribution(
             "LambdaDuration",
             value=duration_ms,
             unit="Milliseconds"
         )
         
-        self.collector.put_metric(
+        self.collector.put_distribution(
             "LambdaMemoryUsed",
             value=memory_used_mb,
             unit="Megabytes"
@@ -311,9 +553,22 @@ def initialize_metrics(
     namespace: str = "FranchiseResales/EmailParser",
     region_name: str = "eu-west-2"
 ):
-    """Initialize global metrics collector."""
+    """
+    Initialize global metrics collector.
+
+    Idempotent for warm Lambda invocations: the handler calls this on
+    every invoke, and each MetricsCollector owns two daemon threads and
+    an atexit hook, so rebuilding one per invoke would leak all three.
+    """
     global _metrics_collector, _email_parser_metrics
-    
+
+    if (
+        _metrics_collector is not None
+        and _metrics_collector.namespace == namespace
+        and _metrics_collector.region_name == region_name
+    ):
+        return
+
     _metrics_collector = MetricsCollector(
         namespace=namespace,
         region_name=region_name
@@ -332,6 +587,6 @@ def get_email_parser_metrics() -> Optional[EmailParserMetrics]:
 
 
 def flush_metrics():
-    """Flush all pending metrics."""
+    """Flush all pending metrics and upload them synchronously."""
     if _metrics_collector:
-        _metrics_collector.flush()
\ No newline at end of file
+        _metrics_collector.drain()
\ No newline at end of file
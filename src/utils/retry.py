@@ -1,12 +1,14 @@
 """
 Retry mechanisms and circuit breaker patterns for robust error handling.
 """
+import logging
+import threading
 import time
 import random
 from typing import Callable, Any, Optional, Type, Union, List
 from functools import wraps
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum, Enum
 
 from .logger import get_logger
 from .exceptions import RetryExhaustedError, ProcessingTimeoutError, BaseEmailParserException, ErrorCode
@@ -14,12 +16,12 @@ from .exceptions import RetryExhaustedError, ProcessingTimeoutError, BaseEmailPa
 logger = get_logger(__name__)
 
 
-class BackoffStrategy(str, Enum):
+class BackoffStrategy(IntEnum):
     """Backoff strategies for retry attempts."""
-    FIXED = "fixed"
-    LINEAR = "linear"
-    EXPONENTIAL = "exponential"
-    EXPONENTIAL_JITTER = "exponential_jitter"
+    FIXED = 0
+    LINEAR = 1
+    EXPONENTIAL = 2
+    EXPONENTIAL_JITTER = 3
 
 
 @dataclass
@@ -40,6 +42,31 @@ class RetryHandler:
     
     def __init__(self, config: RetryConfig):
         self.config = config
+        # Attempts are few and known up front, so resolve the strategy
+        # and cap once here; calculate_delay is then a tuple index plus
+        # an optional jitter draw instead of an enum-comparison chain
+        self._jitter = config.backoff_strategy == BackoffStrategy.EXPONENTIAL_JITTER
+        self._delays = tuple(
+            min(self._base_delay_for(attempt), config.max_delay)
+            for attempt in range(1, config.max_attempts + 1)
+        )
+        # Common decorator usage retries everything; detect it once so
+        # should_retry can skip both isinstance walks per failure
+        self._retry_all = (
+            config.retryable_exceptions == (Exception,)
+            and not config.non_retryable_exceptions
+        )
+    
+    def _base_delay_for(self, attempt: int) -> float:
+        """Compute the un-jittered delay for an attempt at construction time."""
+        strategy = self.config.backoff_strategy
+        if strategy == BackoffStrategy.FIXED:
+            return self.config.base_delay
+        if strategy == BackoffStrategy.LINEAR:
+            return self.config.base_delay * attempt
+        if strategy in (BackoffStrategy.EXPONENTIAL, BackoffStrategy.EXPONENTIAL_JITTER):
+            return self.config.base_delay * (2 ** (attempt - 1))
+        return self.config.base_delay
     
     def calculate_delay(self, attempt: int) -> float:
         """
@@ -51,26 +78,13 @@ class RetryHandler:
         Returns:
             Delay in seconds
         """
-        if self.config.backoff_strategy == BackoffStrategy.FIXED:
-            delay = self.config.base_delay
-        
-        elif self.config.backoff_strategy == BackoffStrategy.LINEAR:
-            delay = self.config.base_delay * attempt
-        
-        elif self.config.backoff_strategy == BackoffStrategy.EXPONENTIAL:
-            delay = self.config.base_delay * (2 ** (attempt - 1))
-        
-        elif self.config.backoff_strategy == BackoffStrategy.EXPONENTIAL_JITTER:
-            base_delay = self.config.base_delay * (2 ** (attempt - 1))
-            # Add jitter to prevent thundering herd
-            jitter = random.uniform(0.1, 0.5) * base_delay
-            delay = base_delay + jitter
-        
-        else:
-            delay = self.config.base_delay
-        
-        # Cap at max delay
-        return min(delay, self.config.max_delay)
+        delay = self._delays[attempt - 1]
+        if self._jitter:
+            # Full jitter: sleep anywhere in [0, capped exponential] so
+            # synchronized producers spread out instead of thundering
+            # the endpoint in lockstep
+            return random.uniform(0, delay)
+        return delay
     
     def should_retry(self, exception: Exception, attempt: int) -> bool:
         """
@@ -87,6 +101,10 @@ class RetryHandler:
         if attempt >= self.config.max_attempts:
             return False
         
+        # Fast path: everything is retryable
+        if self._retry_all:
+            return True
+        
         # Check if exception is non-retryable
         if isinstance(exception, self.config.non_retryable_exceptions):
             return False
@@ -121,12 +139,14 @@ class RetryHandler:
         
         for attempt in range(1, self.config.max_attempts + 1):
             try:
-                logger.debug(
-                    f"Executing function with retry, attempt {attempt}",
-                    function=func.__name__,
-                    attempt=attempt,
-                    max_attempts=self.config.max_attempts
-                )
+                # Guard so the f-string isn't formatted when DEBUG is off
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Executing function with retry, attempt {attempt}",
+                        function=func.__name__,
+                        attempt=attempt,
+                        max_attempts=self.config.max_attempts
+                    )
                 
                 result = func(*args, **kwargs)
                 
@@ -201,18 +221,20 @@ def retry(
         Decorated function with retry logic
     """
     def decorator(func: Callable) -> Callable:
+        # Config is immutable, so build the handler (and its delay
+        # table) once at decoration time rather than per call
+        config = RetryConfig(
+            max_attempts=max_attempts,
+            base_delay=base_delay,
+            max_delay=max_delay,
+            backoff_strategy=backoff_strategy,
+            retryable_exceptions=retryable_exceptions,
+            non_retryable_exceptions=non_retryable_exceptions
+        )
+        handler = RetryHandler(config)
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            config = RetryConfig(
-                max_attempts=max_attempts,
-                base_delay=base_delay,
-                max_delay=max_delay,
-                backoff_strategy=backoff_strategy,
-                retryable_exceptions=retryable_exceptions,
-                non_retryable_exceptions=non_retryable_exceptions
-            )
-            
-            handler = RetryHandler(config)
             return handler.execute_with_retry(func, *args, **kwargs)
         
         return wrapper
@@ -247,50 +269,58 @@ class CircuitBreaker:
         self.failure_count = 0
         self.success_count = 0
         self.last_failure_time = 0
+        # Guards state/counter read-modify-write; without it two threads
+        # can both observe CLOSED and push past the threshold without
+        # ever transitioning
+        self._lock = threading.Lock()
         self.logger = get_logger(f"{__name__}.{name}")
     
     def can_execute(self) -> bool:
         """Check if execution is allowed based on circuit breaker state."""
-        if self.state == CircuitBreakerState.CLOSED:
-            return True
-        
-        if self.state == CircuitBreakerState.OPEN:
-            # Check if recovery timeout has passed
-            if time.time() - self.last_failure_time >= self.config.recovery_timeout:
-                self.state = CircuitBreakerState.HALF_OPEN
-                self.success_count = 0
-                self.logger.info(f"Circuit breaker {self.name} transitioning to HALF_OPEN")
+        with self._lock:
+            if self.state == CircuitBreakerState.CLOSED:
                 return True
+            
+            if self.state == CircuitBreakerState.OPEN:
+                # Check if recovery timeout has passed (monotonic clock so
+                # NTP adjustments can't hold the breaker open)
+                if time.monotonic() - self.last_failure_time >= self.config.recovery_timeout:
+                    self.state = CircuitBreakerState.HALF_OPEN
+                    self.success_count = 0
+                    self.logger.info(f"Circuit breaker {self.name} transitioning to HALF_OPEN")
+                    return True
+                return False
+            
+            if self.state == CircuitBreakerState.HALF_OPEN:
+                return True
+            
             return False
-        
-        if self.state == CircuitBreakerState.HALF_OPEN:
-            return True
-        
-        return False
     
     def record_success(self):
         """Record a successful execution."""
-        if self.state == CircuitBreakerState.HALF_OPEN:
-            self.success_count += 1
-            if self.success_count >= self.config.success_threshold:
-                self.state = CircuitBreakerState.CLOSED
+        with self._lock:
+            if self.state == CircuitBreakerState.HALF_OPEN:
+                self.success_count += 1
+                if self.success_count >= self.config.success_threshold:
+                    self.state = CircuitBreakerState.CLOSED
+                    self.failure_count = 0
+                    self.logger.info(f"Circuit breaker {self.name} transitioning to CLOSED")
+            elif self.state == CircuitBreakerState.CLOSED:
                 self.failure_count = 0
-                self.logger.info(f"Circuit breaker {self.name} transitioning to CLOSED")
-        elif self.state == CircuitBreakerState.CLOSED:
-            self.failure_count = 0
     
     def record_failure(self):
         """Record a failed execution."""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
-        
-        if self.state == CircuitBreakerState.CLOSED:
-            if self.failure_count >= self.config.failure_threshold:
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = time.monotonic()
+            
+            if self.state == CircuitBreakerState.CLOSED:
+                if self.failure_count >= self.config.failure_threshold:
+                    self.state = CircuitBreakerState.OPEN
+                    self.logger.warning(f"Circuit breaker {self.name} transitioning to OPEN")
+            elif self.state == CircuitBreakerState.HALF_OPEN:
                 self.state = CircuitBreakerState.OPEN
-                self.logger.warning(f"Circuit breaker {self.name} transitioning to OPEN")
-        elif self.state == CircuitBreakerState.HALF_OPEN:
-            self.state = CircuitBreakerState.OPEN
-            self.logger.warning(f"Circuit breaker {self.name} transitioning back to OPEN")
+                self.logger.warning(f"Circuit breaker {self.name} transitioning back to OPEN")
     
     def execute(self, func: Callable, *args, **kwargs) -> Any:
         """
@@ -315,9 +345,9 @@ class CircuitBreaker:
         
         try:
             # Execute with timeout
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = func(*args, **kwargs)
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             if execution_time > self.config.timeout:
                 raise ProcessingTimeoutError(
@@ -335,6 +365,7 @@ class CircuitBreaker:
 
 # Global circuit breakers registry
 _circuit_breakers: dict = {}
+_circuit_breakers_lock = threading.Lock()
 
 
 def get_circuit_breaker(
@@ -351,9 +382,16 @@ def get_circuit_breaker(
     Returns:
         CircuitBreaker instance
     """
-    if name not in _circuit_breakers:
-        _circuit_breakers[name] = CircuitBreaker(
-            name=name,
-            config=config or CircuitBreakerConfig()
-        )
-    return _circuit_breakers[name]
\ No newline at end of file
+    # Lock-free hit path: a single .get() instead of a membership test
+    # plus a second hash lookup; the lock is only taken to create
+    cb = _circuit_breakers.get(name)
+    if cb is None:
+        with _circuit_breakers_lock:
+            cb = _circuit_breakers.get(name)
+            if cb is None:
+                cb = CircuitBreaker(
+                    name=name,
+                    config=config or CircuitBreakerConfig()
+                )
+                _circuit_breakers[name] = cb
+    return cb
\ No newline at end of file
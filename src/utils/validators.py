@@ -1,37 +1,241 @@
 """
 Data validation utilities for email parsing and lead data validation.
 """
+import functools
 import re
-from typing import Optional, List, Dict, Any, Tuple
+import string
+import sys
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Tuple, Union, ClassVar, Final, FrozenSet
 from datetime import datetime
-from email_validator import validate_email, EmailNotValidError
+
+try:
+    import hyperscan
+except ImportError:  # Optional dependency; the combined regex is the fallback
+    hyperscan = None
 
 from .logger import get_logger
 from .exceptions import ValidationError
 
 logger = get_logger(__name__)
 
+# Sentinel distinguishing "key absent" from "key present but falsy"
+# in single-lookup dict access
+_MISSING: Final = object()
+
+# email_validator pulls in idna, DNS resolver machinery and large
+# regex tables; imported lazily so entrypoints that never validate an
+# email don't pay for it at cold start
+_validate_email = None
+_EmailNotValidError = None
+
+
+def _load_email_validator():
+    """Bind the email_validator entry points on first use."""
+    global _validate_email, _EmailNotValidError
+    from email_validator import validate_email, EmailNotValidError
+    _validate_email = validate_email
+    _EmailNotValidError = EmailNotValidError
+
+
+# Character-class tables for the memoized validator helpers below.
+# Deleting _PHONE_BODY_CHARS from the encoded input via bytes.translate
+# leaves only disallowed characters; _NAME_ALLOWED turns the old
+# NAME_PATTERN scan into one issuperset call
+_PHONE_BODY_CHARS: Final[bytes] = b'0123456789 \t\n\r\x0b\x0c-()'
+# Delete-table stripping everything but digits and '+'; the input is
+# already verified ASCII, so 128 entries cover it
+_PHONE_STRIP_TABLE: Final[Dict[int, None]] = {
+    i: None for i in range(128) if chr(i) not in '0123456789+'
+}
+_NAME_ALLOWED: Final[FrozenSet[str]] = frozenset(
+    string.ascii_letters + string.whitespace + "-'."
+)
+_REFERENCE_PATTERN: Final[re.Pattern] = re.compile(r'^[a-zA-Z0-9\-_]{1,50}$', re.ASCII)
+
+# Known lead sources. Interned members let CPython's set probe
+# short-circuit on pointer equality when the looked-up key is
+# interned too
+_VALID_LEAD_SOURCES: Final[FrozenSet[str]] = frozenset(sys.intern(s) for s in (
+    'rightbiz', 'daltons', 'homecare', 'b4s',
+    'businesses for sale', 'nda', 'registerinterest'
+))
+# Common spellings of each source mapped to its canonical form; inputs
+# arriving in a known case resolve with a single dict probe, no
+# lower() allocation at all
+_LEAD_SOURCE_LOOKUP: Final[Dict[str, str]] = {
+    variant: source
+    for source in _VALID_LEAD_SOURCES
+    for variant in (source, source.title(), source.upper(), source.capitalize())
+}
+
+
+@dataclass(slots=True)
+class ValidatedLead:
+    """
+    Accumulator for validated lead fields.
+    
+    Slot writes are fixed-offset stores, so validation fills this by
+    attribute instead of hashing dict keys per field; the result is
+    dict-ified once at the validate_lead_data boundary. Field order
+    matches the output dict's key order.
+    """
+    lead_source: Optional[str] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email: Optional[str] = None
+    telephone: Optional[str] = None
+    mobile: Optional[str] = None
+    resale_reference: Optional[str] = None
+    receipt_date: Optional[datetime] = None
+
+
+def _build_suspicious_db():
+    """Compile the suspicious-content patterns into a Hyperscan database."""
+    db = hyperscan.Database()
+    patterns = (rb'<script[^>]*>', rb'javascript:', rb'data:text/html')
+    db.compile(
+        expressions=list(patterns),
+        ids=list(range(1, len(patterns) + 1)),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(patterns)
+    )
+    return db
+
+
+# SIMD-accelerated scanner for large email bodies when python-hyperscan
+# is installed; pattern ids line up with the regex group indices so the
+# two backends share the issue-message mapping
+_SUSPICIOUS_DB = None
+if hyperscan is not None:
+    try:
+        _SUSPICIOUS_DB = _build_suspicious_db()
+    except Exception as e:
+        logger.warning("Failed to build hyperscan database, using regex scanner", error=e)
+
+
+@functools.lru_cache(maxsize=8192)
+def _validate_email_cached(email: str) -> Tuple[bool, Optional[str]]:
+    """
+    Validate a stripped email address, memoizing the result.
+    
+    Addresses repeat heavily across leads (retries, duplicate imports,
+    the same contact enquiring about several listings), and the
+    syntax/IDNA work in email-validator dominates bulk validation time,
+    so repeat lookups resolve from the cache instead.
+    """
+    if _validate_email is None:
+        _load_email_validator()
+    try:
+        # Syntax/IDNA validation only: DNS deliverability lookups
+        # dominate per-address cost and are a poor fit for a hot
+        # ingestion path (see validate_email_address_with_dns)
+        validated_email = _validate_email(email, check_deliverability=False)
+        return True, validated_email.email
+    except _EmailNotValidError as e:
+        logger.debug(f"Email validation failed: {email}", error=str(e))
+        return False, None
+    except Exception as e:
+        logger.warning(f"Unexpected error validating email: {email}", error=e)
+        return False, None
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_phone_cached(phone: str) -> Tuple[bool, Optional[str]]:
+    """Validate and normalize a stripped phone number, memoized."""
+    body = phone[1:] if phone.startswith('+') else phone
+
+    # Length and character-class check; non-ASCII input can't be a
+    # phone number, so a failed encode rejects it outright
+    if len(body) < 7 or len(body) > 20:
+        return False, None
+    try:
+        raw = body.encode('ascii')
+    except UnicodeEncodeError:
+        return False, None
+    if raw.translate(None, _PHONE_BODY_CHARS):
+        return False, None
+
+    # Clean the phone number (str.translate is a C-level filter pass,
+    # no regex machinery for a plain character deletion)
+    cleaned = phone.translate(_PHONE_STRIP_TABLE)
+
+    # Basic validation
+    if len(cleaned) < 7 or len(cleaned) > 20:
+        return False, None
+
+    return True, cleaned
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_name_cached(cleaned: str) -> Tuple[bool, Optional[str]]:
+    """Validate and title-case a stripped name, memoized."""
+    # Check length and character class in one pass each, without
+    # the regex engine
+    if len(cleaned) > 100 or not _NAME_ALLOWED.issuperset(cleaned):
+        return False, None
+
+    # Fast path: first_name/last_name are nearly always a single
+    # run of letters, where one C-level capitalize() matches the
+    # general loop exactly
+    if cleaned.isalpha():
+        return True, cleaned.capitalize()
+
+    # Title-case in a single pass: first letter of each word upper,
+    # the rest lower, runs of whitespace collapsed to one space
+    # (same output as ' '.join(w.capitalize() for w in s.split()))
+    out = []
+    new_word = True
+    for ch in cleaned:
+        if ch.isspace():
+            new_word = True
+        elif new_word:
+            if out:
+                out.append(' ')
+            out.append(ch.upper())
+            new_word = False
+        else:
+            out.append(ch.lower())
+
+    return True, ''.join(out)
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_reference_cached(reference: str) -> Tuple[bool, Optional[str]]:
+    """Validate and uppercase a stripped reference, memoized."""
+    cleaned = reference.upper()
+
+    if not _REFERENCE_PATTERN.fullmatch(cleaned):
+        return False, None
+
+    # The same business reference appears across many leads and ends up
+    # as a dict key downstream; interning makes those equal strings one
+    # object, so later hashing and comparison resolve by pointer
+    return True, sys.intern(cleaned)
+
 
 class DataValidator:
     """
     Comprehensive data validator for lead information.
     """
     
-    # Regex patterns for validation
-    PHONE_PATTERN = re.compile(r'^[\+]?[\d\s\-\(\)]{7,20}$')
-    NAME_PATTERN = re.compile(r'^[a-zA-Z\s\-\'\.]{1,100}$')
-    REFERENCE_PATTERN = re.compile(r'^[a-zA-Z0-9\-_]{1,50}$')
+    # Regex patterns for validation. Anchored so external .match()
+    # callers keep whole-string semantics (the anchors are free under
+    # fullmatch); re.ASCII skips the Unicode tables behind \d and \s
+    PHONE_PATTERN: ClassVar[re.Pattern] = re.compile(r'^[\+]?[\d\s\-\(\)]{7,20}$', re.ASCII)
+    NAME_PATTERN: ClassVar[re.Pattern] = re.compile(r'^[a-zA-Z\s\-\'\.]{1,100}$', re.ASCII)
+    REFERENCE_PATTERN: ClassVar[re.Pattern] = _REFERENCE_PATTERN
     
     # Known lead sources
-    VALID_LEAD_SOURCES = {
-        'rightbiz', 'daltons', 'homecare', 'b4s', 
-        'businesses for sale', 'nda', 'registerinterest'
-    }
+    VALID_LEAD_SOURCES: ClassVar[FrozenSet[str]] = _VALID_LEAD_SOURCES
     
     @classmethod
     def validate_email_address(cls, email: str) -> Tuple[bool, Optional[str]]:
         """
-        Validate email address format and deliverability.
+        Validate email address syntax.
+        
+        Checks format/IDNA only; DNS deliverability is deliberately
+        skipped since it dominates per-address cost in bulk imports.
+        Use validate_email_address_with_dns for an MX check.
         
         Args:
             email: Email address to validate
@@ -39,20 +243,52 @@ class DataValidator:
         Returns:
             Tuple of (is_valid, normalized_email)
         """
-        if not email or not isinstance(email, str):
+        # type() identity beats isinstance on the hot path, and the
+        # walrus folds the strip and emptiness test into the guard
+        if type(email) is not str or not (email := email.strip()):
             return False, None
         
+        return _validate_email_cached(email)
+    
+    @classmethod
+    def validate_email_address_with_dns(cls, email: str) -> Tuple[bool, Optional[str]]:
+        """
+        Validate email address format and DNS deliverability.
+        
+        Performs the MX/deliverability lookup the default validator
+        skips. Slow and network-dependent, so reserve it for flows
+        where a bounced address is costlier than the lookup. Results
+        are not cached: DNS answers change.
+        
+        Args:
+            email: Email address to validate
+            
+        Returns:
+            Tuple of (is_valid, normalized_email)
+        """
+        if type(email) is not str or not (email := email.strip()):
+            return False, None
+        
+        if _validate_email is None:
+            _load_email_validator()
         try:
-            # Use email-validator library for comprehensive validation
-            validated_email = validate_email(email.strip())
+            validated_email = _validate_email(email, check_deliverability=True)
             return True, validated_email.email
-        except EmailNotValidError as e:
+        except _EmailNotValidError as e:
             logger.debug(f"Email validation failed: {email}", error=str(e))
             return False, None
         except Exception as e:
             logger.warning(f"Unexpected error validating email: {email}", error=e)
             return False, None
     
+    @classmethod
+    def cache_clear(cls):
+        """Evict memoized validation results (mainly useful in tests)."""
+        _validate_email_cached.cache_clear()
+        _validate_phone_cached.cache_clear()
+        _validate_name_cached.cache_clear()
+        _validate_reference_cached.cache_clear()
+    
     @classmethod
     def validate_phone_number(cls, phone: str) -> Tuple[bool, Optional[str]]:
         """
@@ -64,21 +300,10 @@ class DataValidator:
         Returns:
             Tuple of (is_valid, normalized_phone)
         """
-        if not phone or not isinstance(phone, str):
-            return False, None
-        
-        # Clean the phone number
-        cleaned = re.sub(r'[^\d\+]', '', phone.strip())
-        
-        # Basic validation
-        if len(cleaned) < 7 or len(cleaned) > 20:
-            return False, None
-        
-        # Check pattern
-        if not cls.PHONE_PATTERN.match(phone.strip()):
+        if type(phone) is not str or not (phone := phone.strip()):
             return False, None
-        
-        return True, cleaned
+
+        return _validate_phone_cached(phone)
     
     @classmethod
     def validate_name(cls, name: str) -> Tuple[bool, Optional[str]]:
@@ -91,22 +316,10 @@ class DataValidator:
         Returns:
             Tuple of (is_valid, normalized_name)
         """
-        if not name or not isinstance(name, str):
-            return False, None
-        
-        # Clean and normalize
-        cleaned = name.strip()
-        if not cleaned:
-            return False, None
-        
-        # Check pattern
-        if not cls.NAME_PATTERN.match(cleaned):
+        if type(name) is not str or not (name := name.strip()):
             return False, None
         
-        # Title case normalization
-        normalized = ' '.join(word.capitalize() for word in cleaned.split())
-        
-        return True, normalized
+        return _validate_name_cached(name)
     
     @classmethod
     def validate_reference(cls, reference: str) -> Tuple[bool, Optional[str]]:
@@ -119,15 +332,10 @@ class DataValidator:
         Returns:
             Tuple of (is_valid, normalized_reference)
         """
-        if not reference or not isinstance(reference, str):
+        if type(reference) is not str or not (reference := reference.strip()):
             return False, None
         
-        cleaned = reference.strip().upper()
-        
-        if not cls.REFERENCE_PATTERN.match(cleaned):
-            return False, None
-        
-        return True, cleaned
+        return _validate_reference_cached(reference)
     
     @classmethod
     def validate_lead_source(cls, lead_source: str) -> Tuple[bool, Optional[str]]:
@@ -140,23 +348,36 @@ class DataValidator:
         Returns:
             Tuple of (is_valid, normalized_lead_source)
         """
-        if not lead_source or not isinstance(lead_source, str):
+        if type(lead_source) is not str or not (lead_source := lead_source.strip()):
             return False, None
         
-        normalized = lead_source.lower().strip()
+        # Known spellings (canonical, Title, UPPER) hit in one dict
+        # probe; anything else falls back to explicit normalization
+        normalized = _LEAD_SOURCE_LOOKUP.get(lead_source)
+        if normalized is not None:
+            return True, normalized
+        
+        normalized = sys.intern(lead_source.lower())
         
-        if normalized not in cls.VALID_LEAD_SOURCES:
+        if normalized not in _VALID_LEAD_SOURCES:
             return False, None
         
         return True, normalized
     
     @classmethod
-    def validate_lead_data(cls, lead_data: Dict[str, Any]) -> Dict[str, Any]:
+    def validate_lead_data(
+        cls,
+        lead_data: Dict[str, Any],
+        _now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """
         Validate and normalize complete lead data.
         
         Args:
             lead_data: Raw lead data dictionary
+            _now: Timestamp to use when receipt_date is missing; batch
+                validation passes one shared value so each lead doesn't
+                take its own clock reading
             
         Returns:
             Validated and normalized lead data
@@ -165,62 +386,80 @@ class DataValidator:
             ValidationError: If validation fails
         """
         errors = {}
-        validated_data = {}
-        
+        lead = ValidatedLead()
+        # One .get() per field instead of the 'in' test plus indexing
+        # the old blocks repeated; the sentinel keeps the distinction
+        # between a missing key and a present-but-empty value
+        get = lead_data.get
+        missing = _MISSING
+
         # Validate required fields
-        required_fields = ['first_name', 'last_name', 'email', 'lead_source']
-        for field in required_fields:
-            if field not in lead_data or not lead_data[field]:
+        for field in ('first_name', 'last_name', 'email', 'lead_source'):
+            if not get(field):
                 errors[field] = f"{field} is required"
-        
+
         # Validate lead source
-        if 'lead_source' in lead_data:
-            is_valid, normalized = cls.validate_lead_source(lead_data['lead_source'])
+        value = get('lead_source', missing)
+        if value is not missing:
+            is_valid, normalized = cls.validate_lead_source(value)
             if is_valid:
-                validated_data['lead_source'] = normalized
+                lead.lead_source = normalized
             else:
-                errors['lead_source'] = f"Invalid lead source: {lead_data['lead_source']}"
-        
+                errors['lead_source'] = f"Invalid lead source: {value}"
+
         # Validate names
-        for name_field in ['first_name', 'last_name']:
-            if name_field in lead_data:
-                is_valid, normalized = cls.validate_name(lead_data[name_field])
+        for name_field in ('first_name', 'last_name'):
+            value = get(name_field, missing)
+            if value is not missing:
+                is_valid, normalized = cls.validate_name(value)
                 if is_valid:
-                    validated_data[name_field] = normalized
-                elif lead_data[name_field]:  # Only error if not empty
-                    errors[name_field] = f"Invalid {name_field}: {lead_data[name_field]}"
-        
+                    setattr(lead, name_field, normalized)
+                elif value:  # Only error if not empty
+                    errors[name_field] = f"Invalid {name_field}: {value}"
+
         # Validate email
-        if 'email' in lead_data:
-            is_valid, normalized = cls.validate_email_address(lead_data['email'])
+        value = get('email', missing)
+        if value is not missing:
+            is_valid, normalized = cls.validate_email_address(value)
             if is_valid:
-                validated_data['email'] = normalized
+                lead.email = normalized
             else:
-                errors['email'] = f"Invalid email address: {lead_data['email']}"
-        
+                errors['email'] = f"Invalid email address: {value}"
+
         # Validate phone numbers (optional)
-        for phone_field in ['telephone', 'mobile']:
-            if phone_field in lead_data and lead_data[phone_field]:
-                is_valid, normalized = cls.validate_phone_number(lead_data[phone_field])
+        for phone_field in ('telephone', 'mobile'):
+            value = get(phone_field)
+            if value:
+                is_valid, normalized = cls.validate_phone_number(value)
                 if is_valid:
-                    validated_data[phone_field] = normalized
+                    setattr(lead, phone_field, normalized)
                 else:
-                    errors[phone_field] = f"Invalid {phone_field}: {lead_data[phone_field]}"
-        
+                    errors[phone_field] = f"Invalid {phone_field}: {value}"
+
         # Validate reference (optional)
-        if 'resale_reference' in lead_data and lead_data['resale_reference']:
-            is_valid, normalized = cls.validate_reference(lead_data['resale_reference'])
+        value = get('resale_reference')
+        if value:
+            is_valid, normalized = cls.validate_reference(value)
             if is_valid:
-                validated_data['resale_reference'] = normalized
+                lead.resale_reference = normalized
             else:
-                errors['resale_reference'] = f"Invalid reference: {lead_data['resale_reference']}"
-        
+                errors['resale_reference'] = f"Invalid reference: {value}"
+
         # Add receipt date if not present
-        if 'receipt_date' not in lead_data:
-            validated_data['receipt_date'] = datetime.utcnow()
+        value = get('receipt_date', missing)
+        if value is missing:
+            lead.receipt_date = _now or datetime.utcnow()
         else:
-            validated_data['receipt_date'] = lead_data['receipt_date']
-        
+            lead.receipt_date = value
+
+        # Dict-ify at the API boundary; unset slots stay out of the
+        # output, same as the old key-by-key dict build
+        validated_data = {
+            name: slot_value
+            for name in ValidatedLead.__slots__
+            if (slot_value := getattr(lead, name)) is not None
+        }
+
         # Copy other fields
         for key, value in lead_data.items():
             if key not in validated_data and key not in errors:
@@ -235,6 +474,52 @@ class DataValidator:
         
         return validated_data
 
+    @classmethod
+    def validate_lead_data_batch(cls, leads: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Validate a batch of leads without raising on individual failures.
+
+        Bulk imports shouldn't abort on the first bad lead, and the
+        per-item try/except here is cheaper than callers wrapping each
+        validate_lead_data call themselves. Validation caches warm up
+        across the whole batch.
+
+        Args:
+            leads: Raw lead data dictionaries
+
+        Returns:
+            Dict with 'validated' (normalized leads, in input order),
+            'errors' (one entry per failed lead with its input index
+            and field errors) and 'summary' counts
+        """
+        # Bind lookups once outside the loop, and take one clock
+        # reading for every lead in the batch missing a receipt_date
+        validate = cls.validate_lead_data
+        now = datetime.utcnow()
+        validated: List[Dict[str, Any]] = []
+        errors: List[Dict[str, Any]] = []
+        add_validated = validated.append
+        add_error = errors.append
+
+        for index, lead in enumerate(leads):
+            try:
+                add_validated(validate(lead, _now=now))
+            except ValidationError as e:
+                add_error({
+                    'index': index,
+                    'field_errors': e.details.get('field_errors', {})
+                })
+
+        return {
+            'validated': validated,
+            'errors': errors,
+            'summary': {
+                'validated': len(validated),
+                'failed': len(errors),
+                'total': len(leads)
+            }
+        }
+
 
 class EmailContentValidator:
     """
@@ -243,7 +528,24 @@ class EmailContentValidator:
     
     MAX_EMAIL_SIZE_MB = 10
     MIN_CONTENT_LENGTH = 10
-    
+
+    # Suspicious-content patterns combined into one alternation and
+    # compiled once, so each email gets a single scan instead of one
+    # compile + scan per pattern. Group index maps back to the
+    # original pattern text for the issue message.
+    _SUSPICIOUS_RE = re.compile(
+        r'(<script[^>]*>)|(javascript:)|(data:text/html)',
+        re.IGNORECASE
+    )
+    _SUSPICIOUS_LABELS = (r'<script[^>]*>', r'javascript:', r'data:text/html')
+    # Byte needles for the bytes fast path, paired with the label index
+    # they report as
+    _SUSPICIOUS_NEEDLES = (
+        (b'<script', 1),
+        (b'javascript:', 2),
+        (b'data:text/html', 3),
+    )
+
     @classmethod
     def validate_email_size(cls, content: str, max_size_mb: Optional[int] = None) -> bool:
         """
@@ -257,21 +559,40 @@ class EmailContentValidator:
             True if size is acceptable
         """
         max_size = (max_size_mb or cls.MAX_EMAIL_SIZE_MB) * 1024 * 1024
-        content_size = len(content.encode('utf-8'))
-        
-        return content_size <= max_size
+
+        # Bound the byte length without materializing a full UTF-8
+        # copy of multi-MB content: every character is at least one
+        # byte and at most four, so most inputs resolve from len()
+        if len(content) > max_size:
+            return False
+        if len(content) * 4 <= max_size:
+            return True
+
+        # Ambiguous zone: encode incrementally and bail as soon as the
+        # running count exceeds the limit
+        total = 0
+        step = 64 * 1024
+        for start in range(0, len(content), step):
+            total += len(content[start:start + step].encode('utf-8'))
+            if total > max_size:
+                return False
+        return True
     
     @classmethod
-    def validate_email_content(cls, content: str) -> Tuple[bool, List[str]]:
+    def validate_email_content(cls, content: Union[str, bytes]) -> Tuple[bool, List[str]]:
         """
         Validate email content structure and quality.
         
         Args:
-            content: Email content to validate
+            content: Email content to validate; raw UTF-8 bytes straight
+                from I/O are accepted and scanned without decoding
             
         Returns:
             Tuple of (is_valid, list_of_issues)
         """
+        if type(content) is bytes:
+            return cls._validate_email_content_bytes(content)
+        
         issues = []
         
         if not content or not isinstance(content, str):
@@ -282,16 +603,31 @@ class EmailContentValidator:
         if len(content.strip()) < cls.MIN_CONTENT_LENGTH:
             issues.append("Email content too short")
         
-        # Check for suspicious content
-        suspicious_patterns = [
-            r'<script[^>]*>',  # Script tags
-            r'javascript:',     # JavaScript URLs
-            r'data:text/html',  # Data URLs
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                issues.append(f"Suspicious content detected: {pattern}")
+        # Check for suspicious content (single pass over the content;
+        # stop early once every pattern has been seen)
+        seen = set()
+        if _SUSPICIOUS_DB is not None:
+            try:
+                _SUSPICIOUS_DB.scan(
+                    content.encode('utf-8', 'replace'),
+                    match_event_handler=lambda pat_id, start, end, flags, ctx: seen.add(pat_id)
+                )
+            except Exception as e:
+                logger.warning("Hyperscan scan failed, falling back to regex", error=e)
+                seen.clear()
+                for match in cls._SUSPICIOUS_RE.finditer(content):
+                    seen.add(match.lastindex)
+                    if len(seen) == len(cls._SUSPICIOUS_LABELS):
+                        break
+        else:
+            for match in cls._SUSPICIOUS_RE.finditer(content):
+                seen.add(match.lastindex)
+                if len(seen) == len(cls._SUSPICIOUS_LABELS):
+                    break
+        for index in sorted(seen):
+            issues.append(
+                f"Suspicious content detected: {cls._SUSPICIOUS_LABELS[index - 1]}"
+            )
         
         # Check encoding issues
         try:
@@ -300,6 +636,44 @@ class EmailContentValidator:
             issues.append("Content contains invalid characters")
         
         return len(issues) == 0, issues
+    
+    @classmethod
+    def _validate_email_content_bytes(cls, content: bytes) -> Tuple[bool, List[str]]:
+        """
+        Bytes counterpart of validate_email_content.
+        
+        Content arriving from S3/SES is UTF-8 bytes already; scanning
+        it directly with bytes.find on one lowercased copy skips the
+        decode and the regex engine entirely. Substring needles stand
+        in for the patterns (a bare '<script' counts as suspicious
+        whether or not its tag closes).
+        """
+        issues = []
+        
+        if not content:
+            issues.append("Email content is empty or invalid")
+            return False, issues
+        
+        # Check minimum content length
+        if len(content.strip()) < cls.MIN_CONTENT_LENGTH:
+            issues.append("Email content too short")
+        
+        # Check for suspicious content
+        lowered = content.lower()
+        find = lowered.find
+        for needle, index in cls._SUSPICIOUS_NEEDLES:
+            if find(needle) != -1:
+                issues.append(
+                    f"Suspicious content detected: {cls._SUSPICIOUS_LABELS[index - 1]}"
+                )
+        
+        # Check encoding issues
+        try:
+            content.decode('utf-8')
+        except UnicodeDecodeError:
+            issues.append("Content contains invalid characters")
+        
+        return len(issues) == 0, issues
 
 
 def validate_and_normalize_lead(raw_data: Dict[str, Any]) -> Dict[str, Any]: